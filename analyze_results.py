@@ -1,22 +1,31 @@
 import argparse
 import csv
-import json
 import math
-from pathlib import Path
+import os
+
+import orjson
+
+
+def _sorted_entries(path: str) -> list[os.DirEntry]:
+    with os.scandir(path) as it:
+        return sorted(it, key=lambda entry: entry.name)
 
 
 def load_results(input_dir: str) -> dict[str, list[float]]:
     data: dict[str, list[float]] = {}
-    input_path = Path(input_dir)
 
-    for config_dir in sorted(input_path.iterdir()):
+    # scandir gives entry types without a stat() per entry (symlinks are still
+    # followed, as Path.is_dir() did); orjson parses the raw bytes.
+    for config_dir in _sorted_entries(input_dir):
         if not config_dir.is_dir():
             continue
         config_name = config_dir.name
         energies = []
-        for trial_file in sorted(config_dir.glob("trial_*.json")):
-            with open(trial_file) as f:
-                trial = json.load(f)
+        for trial_file in _sorted_entries(config_dir.path):
+            if not (trial_file.name.startswith("trial_") and trial_file.name.endswith(".json")):
+                continue
+            with open(trial_file.path, "rb") as f:
+                trial = orjson.loads(f.read())
             if trial.get("success") and trial.get("energy_data"):
                 e = trial["energy_data"].get("total_energy_joules")
                 if e is not None:
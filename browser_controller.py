@@ -27,14 +27,17 @@ SPEED_LABEL_RE = re.compile(r"^\s*\d+(?:\.\d+)?x\s*$", re.I)
 
 
 class BrowserController:
-    def __init__(self, config: dict):
+    # `playwright` is an already started driver shared across trials; without one,
+    # setup() starts a private driver and teardown() stops it.
+    def __init__(self, config: dict, playwright=None):
         self.config       = config
         self.browser_name = config["browser"]
         self.platform     = config["platform"]
         self.speed        = config["speed"]
         self.url          = config["url"]
 
-        self._playwright = None
+        self._owns_playwright = playwright is None
+        self._playwright = playwright
         self._browser    = None
         self._context    = None
         self._page       = None
@@ -47,7 +50,8 @@ class BrowserController:
         import os as _os
         import shutil as _shutil
 
-        self._playwright = sync_playwright().start()
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
 
         context_args = {
             "headless": False,
@@ -126,7 +130,7 @@ class BrowserController:
             if self._context:
                 self._context.close()
         finally:
-            if self._playwright:
+            if self._playwright and self._owns_playwright:
                 self._playwright.stop()
         self._page = self._browser = self._context = self._playwright = None
 
@@ -1,14 +1,31 @@
 import csv
+import functools
 import logging
+import mmap
+from concurrent.futures import Future, ThreadPoolExecutor
 import os
 import platform
 import shutil
 import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+import warnings
 from pathlib import Path
 import cpuinfo
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pac
+except ImportError:   # optional: the NumPy reader below is used instead
+    pa = None
+
+from config import ENERGIBRIDGE_INTERVAL_MS
+
+__all__ = ["EnergyProfiler", "shutdown_parse_pool"]
 
 log = logging.getLogger(__name__)
 
@@ -17,33 +34,100 @@ ENERGIBRIDGE_BIN = os.getenv(
     "energibridge",   # assumed to be on PATH
 )
 
-SAMPLE_INTERVAL_MS = int(os.getenv("ENERGIBRIDGE_INTERVAL_MS", "500"))
+SAMPLE_INTERVAL_MS = ENERGIBRIDGE_INTERVAL_MS
+
+# SYSTEM_POWER (Watts) is instantaneous power, not a cumulative counter, so totals
+# read from it depend on the sampling rate; keep it at the original interval.
+POWER_SAMPLE_INTERVAL_MS = 500
+
+# Energy column candidates per CPU, in order of preference.
+# AMD - CPU_ENERGY, INTEL - PACKAGE_ENERGY, APPLE M1 - SYSTEM_POWER
+# Interned so matching against the (also interned) CSV header is mostly identity checks.
+ENERGY_COLUMNS = {
+    "AMD":   tuple(map(sys.intern, ("CPU_ENERGY (J)",))),
+    "Intel": tuple(map(sys.intern, ("PACKAGE_ENERGY (J)", "PP0_ENERGY (J)", "SYSTEM_POWER (Watts)"))),
+    "Apple": tuple(map(sys.intern, ("SYSTEM_POWER (Watts)",))),
+}
+
+# Interval EnergyBridge samples at for a CPU. Any CPU that may resolve to a
+# (Watts) column is capped, since the column is only known once the CSV exists.
+def _sample_interval_ms(cpu_type: str) -> int:
+    if any(c.endswith("(Watts)") for c in ENERGY_COLUMNS.get(cpu_type, ())):
+        return min(SAMPLE_INTERVAL_MS, POWER_SAMPLE_INTERVAL_MS)
+    return SAMPLE_INTERVAL_MS
+
+
+# tmpfs directory EnergyBridge records into during a run (Linux); the CSV is moved
+# to the results directory once measurement has stopped.
+STAGING_ROOT = Path("/dev/shm")
+
+# Upper bound on how long start() waits for EnergyBridge to begin writing its CSV.
+STARTUP_TIMEOUT_S = 2.0
+
+# CSV parsing runs here so it overlaps with browser teardown and cooldown
+# instead of sitting on the measurement critical path. A thread, not a process:
+# the parse is milliseconds of NumPy/pyarrow work, and forked workers would
+# inherit the Playwright driver's stdin pipe and keep it from ever seeing EOF.
+_POOL: ThreadPoolExecutor | None = None
+
+
+def _parse_pool() -> ThreadPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="energibridge-parse")
+    return _POOL
+
+
+# Waits for queued parses and releases the pool; call once at the end of a run.
+def shutdown_parse_pool():
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=True)
+        _POOL = None
+
+
+@functools.lru_cache(maxsize=1)
+def _cpu_type() -> str:
+    # cpuinfo scrapes /proc/cpuinfo, sysctl or CPUID each call; the answer never changes.
+    manufacturer = cpuinfo.get_cpu_info().get("brand_raw", "").lower()
+
+    if "apple" in manufacturer or "m1" in manufacturer or "m2" in manufacturer:
+        return "Apple"
+
+    if "amd" in manufacturer or "ryzen" in manufacturer:
+        return "AMD"
+
+    if "intel" in manufacturer:
+        return "Intel"
+
+    return "Unknown"
 
 
 class EnergyProfiler:
+    # (candidate columns, header tuple) -> energy column; every run on a machine shares one header.
+    _energy_col_cache: dict[tuple, str | None] = {}
+
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
         self._proc: subprocess.Popen | None = None
         self._output_file: str | None = None
+        self._record_file: str | None = None
+        self._staging_dir: str | None = None
+        self._parse_future: Future | None = None
+        self._live_cols: tuple | None = None
+        self._last_live_row: bytes | None = None
 
         if not dry_run:
             self._check_energibridge()
+            # The CPU never changes, so bind its column candidates into the parser once.
+            self._cpu_type = self.detect_cpu()
+            self._interval_ms = _sample_interval_ms(self._cpu_type)
+            self._parse_fn = self._build_parser(self._cpu_type, self._interval_ms)
 
     # ── Public API ──────────────────────────────────────────────────────────────
 
     def detect_cpu(self):
-        manufacturer = cpuinfo.get_cpu_info().get("brand_raw", "").lower()
-
-        if "apple" in manufacturer or "m1" in manufacturer or "m2" in manufacturer:
-            return "Apple"
-
-        if "amd" in manufacturer or "ryzen" in manufacturer:
-            return "AMD"
-
-        if "intel" in manufacturer:
-            return "Intel"
-
-        return "Unknown"
+        return _cpu_type()
     
     def start(self, output_csv: str):
         self._output_file = output_csv
@@ -52,10 +136,17 @@ class EnergyProfiler:
             log.info("    [DRY-RUN] EnergyBridge skipped.")
             return
 
+        # EnergyBridge writes to tmpfs while measuring, so no disk I/O lands inside
+        # the measured window; stop() moves the CSV to output_csv afterwards.
+        self._record_file = output_csv
+        if STAGING_ROOT.is_dir():
+            self._staging_dir = tempfile.mkdtemp(prefix="energibridge_", dir=STAGING_ROOT)
+            self._record_file = str(Path(self._staging_dir) / Path(output_csv).name)
+
         cmd = [
             ENERGIBRIDGE_BIN,
-            "--output", output_csv,
-            "--interval", str(SAMPLE_INTERVAL_MS),
+            "--output", self._record_file,
+            "--interval", str(self._interval_ms),
             "--",
             *self._idle_command(),
         ]
@@ -65,20 +156,29 @@ class EnergyProfiler:
 
         log.debug(f"    EnergyBridge cmd: {' '.join(cmd)}")
 
-        self._proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-        )
-        time.sleep(0.5)
+        # A leftover CSV from an earlier run would look like an instant start.
+        Path(self._record_file).unlink(missing_ok=True)
 
-        if self._proc.poll() is not None:
-            stderr = self._proc.stderr.read().decode()
-            raise RuntimeError(f"EnergyBridge failed to start: {stderr}")
+        try:
+            self._proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+        except BaseException:
+            # stop() has no process to stop and would never reach _unstage().
+            self._unstage()
+            raise
+        self._wait_until_started()
+
+    # Stops EnergyBridge and queues its CSV for parsing; returns the CSV path.
+    # Call result() when the parsed energy data is actually needed. A forced stop
+    # abandons the run: the CSV is kept but not parsed.
+    def stop(self, force: bool = False) -> str | None:
+        self._parse_future = None
 
-    def stop(self, force: bool = False) -> dict | None:
         if self.dry_run:
-            return {"dry_run": True, "total_energy_joules": None, "samples": 0}
+            return self._output_file
 
         if self._proc is None:
             return None
@@ -97,126 +197,263 @@ class EnergyProfiler:
                 pass
         finally:
             self._proc = None
+            self._live_cols = None
+            self._last_live_row = None
+            self._unstage()
+
+        if force:
+            return None
 
         if self._output_file and Path(self._output_file).exists():
-            return self._parse_csv(self._output_file)
+            self._parse_future = _parse_pool().submit(self._parse_fn, self._output_file)
+            return self._output_file
         return None
 
-    def _parse_csv(self, filepath: str) -> dict:
-        rows = []
+    def _unstage(self):
+        if self._staging_dir is None:
+            return
         try:
-            with open(filepath, newline="") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    rows.append(row)
-        except Exception as e:
-            log.error(f"    Could not parse EnergyBridge CSV: {e}")
-            return {"error": str(e), "samples": 0}
+            if Path(self._record_file).exists():
+                shutil.move(self._record_file, self._output_file)
+        except OSError as e:
+            log.warning(f"    Could not move EnergyBridge CSV out of {self._staging_dir}: {e}")
+        finally:
+            shutil.rmtree(self._staging_dir, ignore_errors=True)
+            self._staging_dir = None
+            self._record_file = self._output_file
+
+    # Power (W) over the newest sample of the CSV being recorded, or None when
+    # EnergyBridge has not written a new row since the previous call.
+    def sample_instantaneous_watts(self) -> float | None:
+        if self.dry_run or self._proc is None:
+            return None
 
-        if not rows:
-            return {"samples": 0, "total_energy_joules": 0.0}
+        try:
+            with open(self._record_file, "rb") as f:
+                if self._live_cols is None:
+                    self._live_cols = self._resolve_live_columns(f.readline())
+                    if self._live_cols is None:
+                        return None
+                # Only the last two complete rows are needed, so read just the tail.
+                f.seek(max(0, os.path.getsize(self._record_file) - 8192))
+                tail = f.read()
+        except OSError:
+            return None
 
-        headers = list(rows[0].keys())
-        log.debug(f"    EnergyBridge CSV headers: {headers}")
+        rows = tail.split(b"\n")[:-1]   # the final piece may be a partial row
+        if len(rows) < 3 or rows[-1] == self._last_live_row:
+            return None
 
-        energy_col = None
-        power_col  = None
-        
-        # AMD - CPU_ENERGY, INTEL - PACKAGE_ENERGY, APPLE M1 - SYSTEM_POWER
-        cpu_type = self.detect_cpu()
+        value_idx, clock_idx, is_power = self._live_cols
+        try:
+            prev = rows[-2].split(b",")
+            last = rows[-1].split(b",")
+            if is_power:
+                watts = float(last[value_idx])
+            else:
+                seconds = (float(last[clock_idx]) - float(prev[clock_idx])) / 1000.0
+                if seconds <= 0:
+                    return None
+                watts = (float(last[value_idx]) - float(prev[value_idx])) / seconds
+        except (IndexError, ValueError):
+            return None
 
-        if cpu_type == "AMD":
-            if "CPU_ENERGY (J)" in headers:
-                energy_col = "CPU_ENERGY (J)"
+        self._last_live_row = rows[-1]
+        return watts
 
-        elif cpu_type == "Intel":
-            if "PACKAGE_ENERGY (J)" in headers:
-                energy_col = "PACKAGE_ENERGY (J)"
-            elif "PP0_ENERGY (J)" in headers:
-                energy_col = "PP0_ENERGY (J)"
-            elif "SYSTEM_POWER (Watts)" in headers:
-                energy_col = "SYSTEM_POWER (Watts)"
+    # (value index, Time index, value-is-power) for the live CSV header, or None.
+    def _resolve_live_columns(self, header_line: bytes) -> tuple | None:
+        headers = next(csv.reader([header_line.decode(errors="replace").strip()]), [])
+        if "Time" not in headers:
+            return None
+        energy_col = next(
+            (c for c in ENERGY_COLUMNS.get(self._cpu_type, ()) if c in headers), None
+        )
+        if energy_col is None:
+            return None
+        return headers.index(energy_col), headers.index("Time"), energy_col.endswith("(Watts)")
 
-        elif cpu_type == "Apple":
-            if "SYSTEM_POWER (Watts)" in headers:
-                energy_col = "SYSTEM_POWER (Watts)"
+    # Blocks until the CSV queued by stop() is parsed and returns its summary.
+    def result(self) -> dict | None:
+        if self.dry_run:
+            return {"dry_run": True, "total_energy_joules": None, "samples": 0}
 
-        if energy_col is None:
-            raise RuntimeError(f"No energy column found for CPU: {cpu_type}")
+        if self._parse_future is None:
+            return None
+        return self._parse_future.result()
+
+    def _wait_until_started(self):
+        # Keep draining stderr so a chatty EnergyBridge cannot fill the pipe and block.
+        # Lines are only kept until startup is confirmed, for the failure message.
+        stderr_lines: list[str] = []
+        started = threading.Event()
+        drain = threading.Thread(
+            target=self._drain_stderr, args=(self._proc.stderr, stderr_lines, started), daemon=True
+        )
+        drain.start()
+
+        # EnergyBridge is sampling once its CSV has content; a failed launch exits instead.
+        csv_path = Path(self._record_file)
+        deadline = time.monotonic() + STARTUP_TIMEOUT_S
+        while self._proc.poll() is None and time.monotonic() < deadline:
+            if csv_path.exists() and csv_path.stat().st_size > 0:
+                break
+            time.sleep(0.01)
+        else:
+            if self._proc.poll() is None:
+                log.debug(f"    EnergyBridge CSV still empty after {STARTUP_TIMEOUT_S}s; assuming started.")
 
-        duration_s  = None
-        delta_times = []
+        if self._proc.poll() is not None:
+            drain.join(timeout=1)
+            raise RuntimeError(f"EnergyBridge failed to start: {''.join(stderr_lines)}")
 
-        if "Delta" in headers:
-            try:
-                deltas_ms = [float(r["Delta"]) for r in rows if r.get("Delta")]
-                if len(deltas_ms) >= 2:
-                    delta_times = [(deltas_ms[i+1] - deltas_ms[i]) / 1000.0
-                                   for i in range(len(deltas_ms) - 1)]
-                    duration_s = deltas_ms[-1] / 1000.0
-            except Exception:
-                pass
-        elif "Time" in headers:
-            try:
-                ts_ms = [float(r["Time"]) for r in rows if r.get("Time")]
-                if len(ts_ms) >= 2:
-                    delta_times = [(ts_ms[i+1] - ts_ms[i]) / 1000.0
-                                   for i in range(len(ts_ms) - 1)]
-                    duration_s = (ts_ms[-1] - ts_ms[0]) / 1000.0
-            except Exception:
-                pass
+        started.set()
+        stderr_lines.clear()
 
-        if not delta_times:
-            interval_s = SAMPLE_INTERVAL_MS / 1000.0
-            delta_times = [interval_s] * max(0, len(rows) - 1)
-            duration_s  = interval_s * len(rows)
-
-        total_energy  = 0.0
-        power_readings = []
-
-        if energy_col:
-            values = []
-            for row in rows:
-                try:
-                    values.append(float(row[energy_col]))
-                except (ValueError, KeyError):
-                    pass
-            if len(values) >= 2 and all(v <= values[i+1]
-                                        for i, v in enumerate(values[:-1])):
-                total_energy = values[-1] - values[0]
-            else:
-                total_energy = sum(values)
-            power_readings = values
-            used_col = energy_col
-
-        elif power_col:
-            power_vals = []
-            for row in rows:
-                try:
-                    power_vals.append(float(row[power_col]))
-                except (ValueError, KeyError):
-                    pass
-            n_pairs = min(len(power_vals), len(delta_times))
-            total_energy = sum(power_vals[i] * delta_times[i]
-                               for i in range(n_pairs))
-            power_readings = power_vals
-            used_col = power_col
+    @staticmethod
+    def _drain_stderr(stream, lines: list[str], started: threading.Event):
+        for raw in iter(stream.readline, b""):
+            line = raw.decode(errors="replace")
+            if not started.is_set():
+                lines.append(line)
+            log.debug(f"    EnergyBridge: {line.rstrip()}")
+
+    # A parser specialised to one CPU type, submitted to the parse pool by stop().
+    @staticmethod
+    def _build_parser(cpu_type: str, sample_interval_ms: int = SAMPLE_INTERVAL_MS):
+        return functools.partial(
+            EnergyProfiler._parse_csv_static,
+            cpu_type=cpu_type,
+            energy_columns=ENERGY_COLUMNS.get(cpu_type, ()),
+            sample_interval_ms=sample_interval_ms,
+        )
+
+    @staticmethod
+    def _parse_csv_static(filepath: str, cpu_type: str, energy_columns: tuple | None = None,
+                          sample_interval_ms: int = SAMPLE_INTERVAL_MS) -> dict:
+        if energy_columns is None:
+            energy_columns = ENERGY_COLUMNS.get(cpu_type, ())
 
+        try:
+            if os.path.getsize(filepath) == 0:
+                return {"samples": 0, "total_energy_joules": 0.0}
+
+            # Map the file once; the header sniff and the NumPy reader both scan
+            # the mapping directly instead of copying through a buffered text layer.
+            with open(filepath, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                headers = next(csv.reader([mm.readline().decode()]), None)
+                if not headers:
+                    return {"samples": 0, "total_energy_joules": 0.0}
+                log.debug(f"    EnergyBridge CSV headers: {headers}")
+
+                headers = [sys.intern(h) for h in headers]
+
+                key = (energy_columns, tuple(headers))
+                if key not in EnergyProfiler._energy_col_cache:
+                    EnergyProfiler._energy_col_cache[key] = next(
+                        (c for c in energy_columns if c in headers), None
+                    )
+                energy_col = EnergyProfiler._energy_col_cache[key]
+
+                if energy_col is None:
+                    raise RuntimeError(f"No energy column found for CPU: {cpu_type}")
+
+                value_idx = headers.index(energy_col)
+                clock_col = "Time" if "Time" in headers else "Delta" if "Delta" in headers else None
+                usecols   = (value_idx,) if clock_col is None else (value_idx, headers.index(clock_col))
+
+                # Load only the needed columns, straight into float64 arrays.
+                data = None
+                if pa is not None:
+                    data = EnergyProfiler._load_columns_arrow(
+                        filepath, [headers[i] for i in usecols]
+                    )
+                if data is None:
+                    data = EnergyProfiler._load_columns(mm, usecols)
+        except RuntimeError:
+            raise
+        except Exception as e:
+            log.error(f"    Could not parse EnergyBridge CSV: {e}")
+            return {"error": str(e), "samples": 0}
+
+        n_rows = data.shape[0]
+        if not n_rows:
+            return {"samples": 0, "total_energy_joules": 0.0}
+
+        values = data[:, 0]
+        values = values[~np.isnan(values)]
+
+        times = np.empty(0)
+        if clock_col is not None:
+            times = data[:, 1]
+            times = times[~np.isnan(times)]
+            if clock_col == "Delta":
+                # Delta is the per-sample interval; accumulate into a clock.
+                times = np.cumsum(times)
+
+        # Duration needs only the clock's endpoints.
+        interval_s = sample_interval_ms / 1000.0
+        if times.size >= 2:
+            duration_s = float(times[-1] - times[0]) / 1000.0
         else:
-            used_col = None
+            duration_s = interval_s * n_rows
+
+        # Cumulative counter if every reading is >= the one before it
+        # (builds one n-1 element boolean mask).
+        if values.size >= 2 and bool(np.all(values[1:] >= values[:-1])):
+            total_energy = values[-1] - values[0]
+        else:
+            total_energy = values.sum()
 
         return {
-            "samples": len(rows),
-            "total_energy_joules": round(total_energy, 4),
-            "energy_column_used": used_col,
+            "samples": n_rows,
+            "total_energy_joules": round(float(total_energy), 4),
+            "energy_column_used": energy_col,
             "duration_seconds": round(duration_s, 2) if duration_s else None,
             "mean_power_watts": (
-                round(total_energy / duration_s, 4)
+                round(float(total_energy) / duration_s, 4)
                 if duration_s and duration_s > 0 else None
             ),
-            "raw_power_readings": power_readings[:5],
+            "raw_power_readings": values[:5].tolist(),
         }
 
+    # Multi-threaded C++ read of `names` via pyarrow; None if the file doesn't convert cleanly.
+    @staticmethod
+    def _load_columns_arrow(filepath: str, names: list[str]) -> np.ndarray | None:
+        try:
+            table = pac.read_csv(
+                filepath,
+                convert_options=pac.ConvertOptions(
+                    include_columns=names,
+                    column_types={name: pa.float64() for name in names},
+                ),
+            )
+        except pa.ArrowInvalid as e:
+            log.debug(f"    pyarrow could not read EnergyBridge CSV, using NumPy: {e}")
+            return None
+        return np.column_stack(
+            [table.column(name).to_numpy(zero_copy_only=False) for name in names]
+        )
+
+    # Reads `usecols` from the rest of `mm` as a 2-D float64 array (NaN = unparsable).
+    @staticmethod
+    def _load_columns(mm: mmap.mmap, usecols: tuple) -> np.ndarray:
+        start = mm.tell()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)   # header-only file
+            try:
+                return np.loadtxt(
+                    iter(mm.readline, b""), delimiter=",", usecols=usecols, ndmin=2
+                )
+            except ValueError:
+                # A malformed cell: fall back to the tolerant (slower) reader.
+                mm.seek(start)
+                return np.genfromtxt(
+                    iter(mm.readline, b""), delimiter=",", usecols=usecols,
+                    invalid_raise=False, ndmin=2,
+                )
+
     @staticmethod
     def _idle_command():
         if platform.system() == "Windows":
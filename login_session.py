@@ -1,11 +1,13 @@
 import argparse
 import time
-from playwright.sync_api import sync_playwright
 
 from config import SPOTIFY_SESSION_FILE
 
 
 def login(browser_name: str = "chrome"):
+    # Imported here so importing this module does not pay for Playwright.
+    from playwright.sync_api import sync_playwright
+
     print(f"Opening {browser_name} for Spotify login...")
 
     with sync_playwright() as pw:
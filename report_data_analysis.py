@@ -1,38 +1,63 @@
-import json
 import math
+import os
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import argparse
 
 import numpy as np
+import orjson
+import matplotlib
+matplotlib.use("Agg")   # file output only; also safe in worker processes
 import matplotlib.pyplot as plt
-import seaborn as sns
 from scipy.stats import shapiro, ttest_ind, mannwhitneyu
 
-import seaborn as sns
-
 
 # Load Energy Data From Trial JSON Files
 
+# total_energy_joules of one trial file, or None for a failed run.
+
+def _load_trial(trial_file):
+    with open(trial_file, "rb") as f:
+        trial = orjson.loads(f.read())
+
+    # Only include successful runs
+    if trial.get("success"):
+        return trial["energy_data"]["total_energy_joules"]
+    return None
+
+
 # Reads all trial_*.json files inside each configuration folder.
 # Extracts total_energy_joules for successful runs.
 # Returns: { config_name : [list of energy values] }
 
+# Trial files are small and independent, so reads are fanned out over a
+# thread pool to overlap their open/read latency.
+
 def load_data(results_dir):
     data = defaultdict(list)
 
-    for config_dir in Path(results_dir).iterdir():
-        if not config_dir.is_dir():
-            continue
+    # scandir reports entry types from the directory listing itself, so no
+    # per-entry stat() is needed to find configs and trial files (symlinked
+    # config dirs are still followed, as Path.is_dir() did).
+    trial_files = []
+    with os.scandir(results_dir) as config_dirs:
+        for config_dir in config_dirs:
+            if not config_dir.is_dir():
+                continue
+
+            with os.scandir(config_dir.path) as entries:
+                for entry in entries:
+                    if entry.name.startswith("trial_") and entry.name.endswith(".json"):
+                        trial_files.append((config_dir.name, entry.path))
 
-        for trial_file in config_dir.glob("trial_*.json"):
-            with open(trial_file) as f:
-                trial = json.load(f)
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        energies = pool.map(_load_trial, [trial_file for _, trial_file in trial_files])
 
-            # Only include successful runs
-            if trial.get("success"):
-                energy = trial["energy_data"]["total_energy_joules"]
-                data[config_dir.name].append(energy)
+        for (config, _), energy in zip(trial_files, energies):
+            if energy is not None:
+                data[config].append(energy)
 
     return data
 
@@ -41,19 +66,22 @@ def load_data(results_dir):
 
 # Removes values where:
 # |x − mean| > 3 * std
-# Returns cleaned list + number of removed samples
+# Returns cleaned float64 array + number of removed samples
+# Fewer than 4 samples are returned as-is: the sample std is undefined
+# (n = 1) or too noisy for a 3-sigma cut.
 
 def remove_outliers(values):
-    mean = np.mean(values)
-    std = np.std(values, ddof=1)  # sample standard deviation
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size < 4:
+        return arr, 0
 
-    filtered = [
-        x for x in values
-        if abs(x - mean) <= 3 * std
-    ]
+    mean = arr.mean()
+    std = arr.std(ddof=1)  # sample standard deviation
+
+    mask = np.abs(arr - mean) <= 3 * std
 
-    removed = len(values) - len(filtered)
-    return filtered, removed
+    removed = int(arr.size - mask.sum())
+    return arr[mask], removed
 
 
 # Descriptive Statistics
@@ -63,70 +91,129 @@ def remove_outliers(values):
 # - mean
 # - standard deviation (sample)
 # - median
+# values: float64 ndarray (see main)
+# Returned as a lightweight named tuple rather than a dict.
+
+Description = namedtuple("Description", ["n", "mean", "std", "median"])
+
 
 def describe(values):
-    return {
-        "n": len(values),
-        "mean": np.mean(values),
-        "std": np.std(values, ddof=1),
-        "median": np.median(values),
-    }
+    return Description(
+        n=values.size,
+        mean=float(values.mean()),
+        std=float(values.std(ddof=1)),
+        median=float(np.median(values)),
+    )
+
+
+# Batched SciPy calls
+
+# Stacks variable-length groups into one 2-D array, NaN-padded to `width`,
+# so a test can run over all of them in one call with axis=1, nan_policy="omit".
+
+def _stack_padded(groups, width):
+    out = np.full((len(groups), width), np.nan)
+    for row, values in zip(out, groups):
+        row[:len(values)] = values
+    return out
 
 
 # Normality Test (Shapiro-Wilk)
 
-# Returns:
+# Tests every configuration in one shapiro call.
+
+# Returns, per configuration:
 #   p-value
 #   Boolean flag (True = normal assumed)
 
-def normality_test(values):
-    stat, p = shapiro(values)
-    is_normal = p >= 0.05   # p < 0.05 → not normal
-    return p, is_normal
+def normality_tests(data):
+    configs = list(data)
+    if not configs:
+        return {}
+
+    groups = [data[config] for config in configs]
+    _, ps = shapiro(
+        _stack_padded(groups, max(len(g) for g in groups)), axis=1, nan_policy="omit"
+    )
+    # p < 0.05 → not normal
+    return {config: (p, p >= 0.05) for config, p in zip(configs, ps)}
 
 # Statistical Hypothesis Testing
 
 # If both groups normal -> Welch's t-test
 # If not normal -> Mann-Whitney U test
 
-# Returns:
+# All pairs that use the same test go through one batched SciPy call
+# instead of one call per pair.
+
+# stats: { config_name : config_stats(...) }
+
+# Returns, per (a, b) pair in input order:
 #   test name
 #   p-value
+#   test statistic (t, or U for Mann-Whitney; reused for CLES)
 
-def compare_groups(a, b, normal_a, normal_b):
-    normal = normal_a and normal_b
+def compare_pairs(pairs, stats):
+    results = [None] * len(pairs)
 
-    if normal:
-        stat, p = ttest_ind(a, b, equal_var=False) 
-        test_name = "Welch's t-test"
-    else:
-        stat, p = mannwhitneyu(a, b, alternative="two-sided")
-        test_name = "Mann-Whitney U"
+    by_test = {True: [], False: []}
+    for i, (a, b) in enumerate(pairs):
+        by_test[stats[a].normal and stats[b].normal].append(i)
+
+    for normal, indices in by_test.items():
+        if not indices:
+            continue
+
+        groups_a = [stats[pairs[i][0]].arr for i in indices]
+        groups_b = [stats[pairs[i][1]].arr for i in indices]
+        width = max(len(g) for g in groups_a + groups_b)
+        A = _stack_padded(groups_a, width)
+        B = _stack_padded(groups_b, width)
+
+        if normal:
+            stat, p = ttest_ind(A, B, axis=1, equal_var=False, nan_policy="omit")
+            test_name = "Welch's t-test"
+        else:
+            stat, p = mannwhitneyu(A, B, axis=1, alternative="two-sided", nan_policy="omit")
+            test_name = "Mann-Whitney U"
 
-    return test_name, p
+        for row, i in enumerate(indices):
+            results[i] = (test_name, p[row], stat[row])
+
+    return results
 
 
 # Effect Size (Parametric)
 
 # Cohen's d: Measures standardized mean difference
 # Used only when data are normal
+# a, b: config_stats(...) namespaces
+
+# Mean and sample variance from one sum and one sum of squares.
+# Energies are a few hundred joules with a spread of tens, so the
+# sum-of-squares form loses no meaningful precision here.
+def _moments(arr):
+    n = arr.size
+    mean = np.add.reduce(arr, dtype=np.float64) / n
+    sum_sq = np.add.reduce(arr * arr, dtype=np.float64)
+    var = (sum_sq - n * mean * mean) / (n - 1)
+    return mean, var
+
 
 def cohens_d(a, b):
-    mean_diff = np.mean(a) - np.mean(b)
-    pooled_std = math.sqrt(
-        (np.var(a, ddof=1) + np.var(b, ddof=1)) / 2
-    )
-    return mean_diff / pooled_std
+    pooled_std = math.sqrt((a.var + b.var) / 2)
+    return (a.mean - b.mean) / pooled_std
 
 
 # Effect Size (Non-Parametric)
 
 # Median difference:
 #   Difference in medians (delta M)
+# a, b: config_stats(...) namespaces
 
 
 def median_difference(a, b):
-    return np.median(a) - np.median(b)
+    return a.median - b.median
 
 
 # Common Language Effect Size (CLES):
@@ -134,23 +221,140 @@ def median_difference(a, b):
 
 #   Interpreted as probability that
 #   a random value from A > random value from B
-def common_language_effect_size(a, b):
-    stat, _ = mannwhitneyu(a, b, alternative="two-sided")
-    n1 = len(a)
-    n2 = len(b)
-    return stat / (n1 * n2)
+#   Takes the U statistic compare_pairs already computed,
+#   so Mann-Whitney is not run a second time.
+def common_language_effect_size_from_u(u, n1, n2):
+    return u / (n1 * n2)
+
+
+# Per-Configuration Statistics
+
+# Everything the significance and effect-size stages need for one
+# configuration, computed once instead of per stage and per pair.
+
+def config_stats(arr, normal):
+    mean, var = _moments(arr)
+    return SimpleNamespace(
+        arr=arr,
+        n=arr.size,
+        mean=mean,
+        var=var,
+        median=np.median(arr),
+        normal=normal,
+    )
 
 
 # Plotting (Exploratory Visualisation)
 
-def plot_main_results(data, output_dir="results/plots"):
+# Every figure is drawn by a top-level _render_* function taking picklable
+# arguments. plot_main_results and plot_appendix_results only prepare the data
+# and the render jobs; main() runs those on a process pool, so independent
+# figures (render + PNG encode) are produced in parallel.
+
+def _init_plot_worker():
+    plt.style.use("seaborn-v0_8-whitegrid")
+    # 150 dpi is plenty for these charts and PNG encoding cost scales with the
+    # pixel count; autolayout replaces a tight_layout() call per figure.
+    plt.rcParams["savefig.dpi"] = 150
+    plt.rcParams["figure.autolayout"] = True
+
+
+# One figure per size, kept open for the life of the worker process and cleared
+# between renders, so consecutive plots skip figure and canvas construction.
+_FIGURES = {}
+
+
+def _reusable_figure(figsize):
+    fig = _FIGURES.get(figsize)
+    if fig is None:
+        fig = _FIGURES[figsize] = plt.figure(figsize=figsize)
+    else:
+        fig.clf()
+        plt.figure(fig.number)
+    return fig
+
+
+def _render_playback_difference(labels, values, path):
+    _reusable_figure((8, 5))
+    plt.bar(labels, values)
+    plt.axhline(0)
+    plt.ylabel("Energy Difference (2x - 1x) [J]")
+    plt.title("Energy Difference Between 2x and 1x Playback")
+
+    for i, v in enumerate(values):
+        plt.text(i, v, f"{v:.2f} J",
+                 ha="center",
+                 va="bottom" if v >= 0 else "top")
+
+    plt.xticks(rotation=20)
+    plt.savefig(path)
+
+
+def _render_speed_boxplot(groups, labels, title, path):
+    _reusable_figure((8, 5))
+    plt.boxplot(groups, positions=range(len(groups)))
+    plt.xticks(range(len(labels)), labels)
+    plt.ylabel("Energy (J)")
+    plt.title(title)
+    plt.savefig(path)
+
+
+def _render_platform_comparison(browsers, apple_means, spotify_means, path):
+    x = np.arange(len(browsers))
+    width = 0.35
+
+    _reusable_figure((8, 5))
+    plt.bar(x - width / 2, apple_means, width, label="Apple Podcasts")
+    plt.bar(x + width / 2, spotify_means, width, label="Spotify")
+
+    plt.xticks(x, browsers)
+    plt.ylabel("Average Energy (J)")
+    plt.title("Average Energy Consumption by Platform and Browser")
+    plt.legend()
+    plt.savefig(path)
+
+
+def _render_global_box(configs, values, path):
+    _reusable_figure((14, 6))
+    plt.boxplot(values, positions=range(len(values)))
+    plt.xticks(range(len(configs)), configs, rotation=30)
+    plt.ylabel("Energy (Joules)")
+    plt.title("Energy Consumption by Configuration")
+    plt.savefig(path)
+
+
+def _render_global_violin(configs, values, path):
+    _reusable_figure((14, 6))
+    plt.violinplot(values, positions=range(len(values)), showmedians=True)
+    plt.xticks(range(len(configs)), configs, rotation=30)
+    plt.ylabel("Energy (Joules)")
+    plt.title("Energy Distribution by Configuration")
+    plt.savefig(path)
+
+
+def _render_pair_box(a, b, values_a, values_b, path):
+    _reusable_figure((6, 5))
+    plt.boxplot([values_a, values_b], positions=[0, 1])
+    plt.xticks([0, 1], [a, b], rotation=15)
+    plt.ylabel("Energy (Joules)")
+    plt.title(f"{a} vs {b}")
+    plt.savefig(path)
+
 
-    sns.set(style="whitegrid")
+# Both return (output directory, render jobs); each job is a (function, *args)
+# tuple for main() to run on the plot pool.
+
+def plot_main_results(data, output_dir="results/plots"):
 
     output_dir = Path(output_dir)
     main_dir = output_dir / "main_figures"
     main_dir.mkdir(parents=True, exist_ok=True)
 
+    jobs = []
+
+    # Per-configuration means, shared by figures 1 and 4
+    means = {name: float(np.mean(values)) for name, values in data.items()}
+
     # PLAYBACK DIFFERENCE (Section 3.1)
 
     comparisons = [
@@ -163,30 +367,16 @@ def plot_main_results(data, output_dir="results/plots"):
     differences = {}
 
     for one_x, two_x, label in comparisons:
-        if one_x in data and two_x in data:
-            mean_1x = np.mean(data[one_x])
-            mean_2x = np.mean(data[two_x])
-            differences[label] = mean_2x - mean_1x
+        if one_x in means and two_x in means:
+            differences[label] = means[two_x] - means[one_x]
 
     if differences:
-        labels = list(differences.keys())
-        values = list(differences.values())
-
-        plt.figure(figsize=(8, 5))
-        plt.bar(labels, values)
-        plt.axhline(0)
-        plt.ylabel("Energy Difference (2x - 1x) [J]")
-        plt.title("Energy Difference Between 2x and 1x Playback")
-
-        for i, v in enumerate(values):
-            plt.text(i, v, f"{v:.2f} J",
-                     ha="center",
-                     va="bottom" if v >= 0 else "top")
-
-        plt.xticks(rotation=20)
-        plt.tight_layout()
-        plt.savefig(main_dir / "figure1_playback_difference.png", dpi=300)
-        plt.close()
+        jobs.append((
+            _render_playback_difference,
+            list(differences.keys()),
+            list(differences.values()),
+            main_dir / "figure1_playback_difference.png",
+        ))
 
     # CHROME PLAYBACK BOXPLOT (Section 3.2)
 
@@ -204,14 +394,13 @@ def plot_main_results(data, output_dir="results/plots"):
             chrome_labels.append(label)
 
     if chrome_groups:
-        plt.figure(figsize=(8, 5))
-        sns.boxplot(data=chrome_groups)
-        plt.xticks(range(len(chrome_labels)), chrome_labels)
-        plt.ylabel("Energy (J)")
-        plt.title("Playback Speed Comparison - Chrome")
-        plt.tight_layout()
-        plt.savefig(main_dir / "figure2_chrome_boxplot.png", dpi=300)
-        plt.close()
+        jobs.append((
+            _render_speed_boxplot,
+            chrome_groups,
+            chrome_labels,
+            "Playback Speed Comparison - Chrome",
+            main_dir / "figure2_chrome_boxplot.png",
+        ))
 
     # BRAVE PLAYBACK BOXPLOT (Section 3.2)
 
@@ -229,70 +418,44 @@ def plot_main_results(data, output_dir="results/plots"):
             brave_labels.append(label)
 
     if brave_groups:
-        plt.figure(figsize=(8, 5))
-        sns.boxplot(data=brave_groups)
-        plt.xticks(range(len(brave_labels)), brave_labels)
-        plt.ylabel("Energy (J)")
-        plt.title("Playback Speed Comparison Brave")
-        plt.tight_layout()
-        plt.savefig(main_dir / "figure3_brave_boxplot.png", dpi=300)
-        plt.close()
+        jobs.append((
+            _render_speed_boxplot,
+            brave_groups,
+            brave_labels,
+            "Playback Speed Comparison Brave",
+            main_dir / "figure3_brave_boxplot.png",
+        ))
 
     # PLATFORM COMPARISON BAR CHART (Section 3.3)
 
-    summary = {
-        "Chrome": {"Apple": [], "Spotify": []},
-        "Brave": {"Apple": [], "Spotify": []},
-    }
+    # Each cell averages the 1x and 2x configuration means
+    def platform_mean(browser, platform):
+        return np.mean([
+            means[name]
+            for name in (f"{browser}_{platform}_1x", f"{browser}_{platform}_2x")
+            if name in means
+        ])
 
-    for config, values in data.items():
-        mean_val = np.mean(values)
-
-        browser = None
-        platform = None
-
-        if "chrome" in config:
-            browser = "Chrome"
-        elif "brave" in config:
-            browser = "Brave"
-
-        if "apple" in config:
-            platform = "Apple"
-        elif "spotify" in config:
-            platform = "Spotify"
-
-        if browser and platform:
-            summary[browser][platform].append(mean_val)
-
-    chrome_apple = np.mean(summary["Chrome"]["Apple"])
-    chrome_spotify = np.mean(summary["Chrome"]["Spotify"])
-    brave_apple = np.mean(summary["Brave"]["Apple"])
-    brave_spotify = np.mean(summary["Brave"]["Spotify"])
+    chrome_apple = platform_mean("chrome", "apple")
+    chrome_spotify = platform_mean("chrome", "spotify")
+    brave_apple = platform_mean("brave", "apple")
+    brave_spotify = platform_mean("brave", "spotify")
 
     browsers = ["Chrome", "Brave"]
     apple_means = [chrome_apple, brave_apple]
     spotify_means = [chrome_spotify, brave_spotify]
 
-    x = np.arange(len(browsers))
-    width = 0.35
-
-    plt.figure(figsize=(8, 5))
-    plt.bar(x - width / 2, apple_means, width, label="Apple Podcasts")
-    plt.bar(x + width / 2, spotify_means, width, label="Spotify")
+    jobs.append((
+        _render_platform_comparison,
+        browsers,
+        apple_means,
+        spotify_means,
+        main_dir / "figure4_platform_comparison.png",
+    ))
 
-    plt.xticks(x, browsers)
-    plt.ylabel("Average Energy (J)")
-    plt.title("Average Energy Consumption by Platform and Browser")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(main_dir / "figure4_platform_comparison.png", dpi=300)
-    plt.close()
-
-    print(f"Main results figures saved to {main_dir}")
+    return main_dir, jobs
 
 def plot_appendix_results(data, output_dir="results"):
-    sns.set(style="whitegrid")
-
     output_dir = Path(output_dir)
     plots_dir = output_dir / "plots"
 
@@ -306,25 +469,12 @@ def plot_appendix_results(data, output_dir="results"):
     configs = list(data.keys())
     values = list(data.values())
 
-    # GLOBAL BOX PLOT
-    plt.figure(figsize=(14, 6))
-    sns.boxplot(data=values)
-    plt.xticks(range(len(configs)), configs, rotation=30)
-    plt.ylabel("Energy (Joules)")
-    plt.title("Energy Consumption by Configuration")
-    plt.tight_layout()
-    plt.savefig(box_dir / "global_boxplot.png", dpi=300)
-    plt.close()
-
-    # GLOBAL VIOLIN PLOT
-    plt.figure(figsize=(14, 6))
-    sns.violinplot(data=values)
-    plt.xticks(range(len(configs)), configs, rotation=30)
-    plt.ylabel("Energy (Joules)")
-    plt.title("Energy Distribution by Configuration")
-    plt.tight_layout()
-    plt.savefig(violin_dir / "global_violinplot.png", dpi=300)
-    plt.close()
+    jobs = [
+        # GLOBAL BOX PLOT
+        (_render_global_box, configs, values, box_dir / "global_boxplot.png"),
+        # GLOBAL VIOLIN PLOT
+        (_render_global_violin, configs, values, violin_dir / "global_violinplot.png"),
+    ]
 
     # PAIRWISE BOX PLOTS
     pairs = [
@@ -336,16 +486,11 @@ def plot_appendix_results(data, output_dir="results"):
 
     for a, b in pairs:
         if a in data and b in data:
-            plt.figure(figsize=(6, 5))
-            sns.boxplot(data=[data[a], data[b]])
-            plt.xticks([0, 1], [a, b], rotation=15)
-            plt.ylabel("Energy (Joules)")
-            plt.title(f"{a} vs {b}")
-            plt.tight_layout()
-            plt.savefig(box_dir / f"{a}_vs_{b}.png", dpi=300)
-            plt.close()
+            jobs.append((
+                _render_pair_box, a, b, data[a], data[b], box_dir / f"{a}_vs_{b}.png"
+            ))
 
-    print(f"Plots saved under {plots_dir}")
+    return plots_dir, jobs
 
 # MAIN ANALYSIS PIPELINE
 
@@ -370,7 +515,8 @@ def main():
     cleaned_data = {}
     total_removed = 0
 
-    # Remove statistical outliers per configuration
+    # Remove statistical outliers per configuration.
+    # Kept as the contiguous float64 arrays remove_outliers returns, so no later stage re-converts lists.
     for config, values in data.items():
         filtered, removed = remove_outliers(values)
         cleaned_data[config] = filtered
@@ -387,20 +533,26 @@ def main():
         stats = describe(values)
         print(f"{config}: {stats}")
 
-    # Generate plots
-    plot_appendix_results(cleaned_data)
-    
-    #Generate blog style plots
-    plot_main_results(cleaned_data)
+    # Generate plots (appendix + blog style), rendered in parallel worker processes
+    plots_dir, jobs = plot_appendix_results(cleaned_data)
+    main_dir, main_jobs = plot_main_results(cleaned_data)
+    jobs += main_jobs
+
+    workers = min(os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_plot_worker) as executor:
+        for future in [executor.submit(*job) for job in jobs]:
+            future.result()
+
+    print(f"Plots saved under {plots_dir}")
+    print(f"Main results figures saved to {main_dir}")
 
     print("\n=== 3.3 Normality Testing ===\n")
 
-    normality_results = {}
+    group_stats = {}
 
-    # Perform Shapiro-Wilk test per configuration
-    for config, values in cleaned_data.items():
-        p, is_normal = normality_test(values)
-        normality_results[config] = is_normal
+    # Perform Shapiro-Wilk test for all configurations at once
+    for config, (p, is_normal) in normality_tests(cleaned_data).items():
+        group_stats[config] = config_stats(cleaned_data[config], is_normal)
 
         print(f"{config}:")
         print(f"  Shapiro p = {p:.6f}")
@@ -418,36 +570,30 @@ def main():
 
     comparison_results = []
 
-    for a, b in pairs:
-        if a in cleaned_data and b in cleaned_data:
-
-            test_name, p = compare_groups(
-                cleaned_data[a],
-                cleaned_data[b],
-                normality_results[a],
-                normality_results[b],
-            )
+    pairs = [(a, b) for a, b in pairs if a in cleaned_data and b in cleaned_data]
+    tests = compare_pairs(pairs, group_stats)
 
-            significance = "statistically significant" if p < 0.05 else "not significant"
+    for (a, b), (test_name, p, stat) in zip(pairs, tests):
+        significance = "statistically significant" if p < 0.05 else "not significant"
 
-            print(f"{a} vs {b}")
-            print(f"  Test used: {test_name}")
-            print(f"  p-value: {p:.6f}")
-            print(f"  Result: {significance}\n")
+        print(f"{a} vs {b}")
+        print(f"  Test used: {test_name}")
+        print(f"  p-value: {p:.6f}")
+        print(f"  Result: {significance}\n")
 
-            comparison_results.append((a, b, p))
+        comparison_results.append((a, b, p, stat))
 
     print("\n=== 3.5 Effect Size Analysis ===\n")
 
     # Compute effect sizes depending on normality
-    for a, b, p in comparison_results:
+    for a, b, p, stat in comparison_results:
 
-        normal = normality_results[a] and normality_results[b]
+        normal = group_stats[a].normal and group_stats[b].normal
 
         print(f"{a} vs {b}")
 
         if normal:
-            d = cohens_d(cleaned_data[a], cleaned_data[b])
+            d = cohens_d(group_stats[a], group_stats[b])
 
             abs_d = abs(d)
             if abs_d < 0.2:
@@ -464,8 +610,8 @@ def main():
             print(f"  Magnitude: {interpretation}\n")
 
         else:
-            delta_m = median_difference(cleaned_data[a], cleaned_data[b])
-            cles = common_language_effect_size(cleaned_data[a], cleaned_data[b])
+            delta_m = median_difference(group_stats[a], group_stats[b])
+            cles = common_language_effect_size_from_u(stat, group_stats[a].n, group_stats[b].n)
 
             print(f"  Effect size method: Non-parametric")
             print(f"  Median difference (delta M) = {delta_m:.4f}")
@@ -1,25 +1,46 @@
-import json
 import logging
+import os
 from pathlib import Path
 
+import orjson
+
 log = logging.getLogger(__name__)
 
+# Indented like json.dump(indent=2); NumPy scalars/arrays serialise as-is.
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
 
 class ResultsManager:
     def __init__(self, output_dir: str = "results"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensured: set[str] = set()   # config dirs already created
 
-    def energy_filepath(self, config_name: str, run_id: int) -> str:
+    def _config_dir(self, config_name: str) -> Path:
         path = self.output_dir / config_name
-        path.mkdir(parents=True, exist_ok=True)
-        return str(path / f"energy_run_{run_id:02d}.csv")
+        if config_name not in self._ensured:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured.add(config_name)
+        return path
+
+    def energy_filepath(self, config_name: str, run_id: int) -> str:
+        return str(self._config_dir(config_name) / f"energy_run_{run_id:02d}.csv")
 
     def save_trial(self, result: dict):
         config_name = result["config"]
         run_id = result["run_id"]
-        path = self.output_dir / config_name / f"trial_{run_id:02d}.json"
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(result, f, indent=2)
+        path = self._config_dir(config_name) / f"trial_{run_id:02d}.json"
+        self._write_json(path, result)
         log.debug(f"    Saved trial result: {path}")
+
+    def save_summary(self, summary: list) -> Path:
+        path = self.output_dir / "summary.json"
+        self._write_json(path, summary)
+        return path
+
+    # Write then rename, so an interrupted run never leaves a truncated JSON file.
+    @staticmethod
+    def _write_json(path: Path, obj):
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(orjson.dumps(obj, option=JSON_OPTIONS))
+        os.replace(tmp, path)
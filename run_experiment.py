@@ -1,14 +1,20 @@
 import argparse
-import json
 import logging
+import shutil
+import statistics
 import sys
+import tempfile
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+from playwright.sync_api import sync_playwright
+
 from config import CONFIGS, EXPERIMENT_SETTINGS
 from browser_controller import BrowserController
-from energy_profiler import EnergyProfiler
+from energy_profiler import EnergyProfiler, shutdown_parse_pool
 from results_manager import ResultsManager
 
 Path("logs").mkdir(exist_ok=True)
@@ -51,13 +57,74 @@ def parse_args():
     return parser.parse_args()
 
 
-def run_single_trial(config: dict, run_id: int, dry_run: bool, output_dir: str) -> dict:
+# Cooldown that ends once idle power has settled instead of always waiting the
+# full cooldown_seconds. A scratch EnergyBridge recording is polled once a second;
+# after at least min_seconds, the wait ends when the last stability_window
+# readings vary by less than epsilon_watts (std dev). cooldown_seconds stays the
+# upper bound, and dry runs just sleep for it. While `busy` (the previous trial's
+# parse + save) is still running, readings are discarded: that is our own load.
+def wait_for_idle(profiler: EnergyProfiler, min_seconds=15, stability_window=5, epsilon_watts=0.2,
+                  busy: Future | None = None) -> float:
+    cooldown = EXPERIMENT_SETTINGS["cooldown_seconds"]
+    if profiler.dry_run:
+        time.sleep(cooldown)
+        return cooldown
+
+    started = time.monotonic()
+    deadline = started + cooldown
+    floor = started + min(min_seconds, cooldown)
+    readings = deque(maxlen=stability_window)
+
+    scratch_dir = tempfile.mkdtemp(prefix="cooldown_")
+    try:
+        profiler.start(str(Path(scratch_dir) / "idle.csv"))
+        while time.monotonic() < deadline:
+            time.sleep(1)
+            watts = profiler.sample_instantaneous_watts()
+            if busy is not None:
+                # This reading may still overlap the tail of the background work.
+                if busy.done():
+                    busy = None
+                continue
+            if watts is not None:
+                readings.append(watts)
+            if (time.monotonic() >= floor
+                    and len(readings) == stability_window
+                    and statistics.pstdev(readings) < epsilon_watts):
+                break
+    except Exception as e:
+        log.warning(f"    Idle detection unavailable ({e}); sleeping out the cooldown.")
+        time.sleep(max(0.0, deadline - time.monotonic()))
+    finally:
+        profiler.stop(force=True)
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    return time.monotonic() - started
+
+
+# Collects the parsed energy data into result and writes the trial JSON.
+def _finish_trial(profiler: EnergyProfiler, result: dict, results_mgr: ResultsManager):
+    # Parsing ran in the background during teardown; collect it now.
+    if result["success"]:
+        try:
+            result["energy_data"] = profiler.result()
+        except Exception as e:
+            log.error(f"    Could not parse energy data: {e}", exc_info=True)
+            result["success"] = False
+            result["error"] = str(e)
+
+    results_mgr.save_trial(result)
+
+
+# With io_pool, collecting and saving the result overlaps the cooldown; it is
+# still finished before this returns, i.e. before the next trial's setup.
+def run_single_trial(config: dict, run_id: int, dry_run: bool, results_mgr: ResultsManager,
+                     playwright=None, io_pool: ThreadPoolExecutor | None = None) -> dict:
     config_name = config["name"]
     log.info(f"  Trial {run_id + 1} | {config_name}")
 
-    results_mgr = ResultsManager(output_dir)
     profiler = EnergyProfiler(dry_run=dry_run)
-    controller = BrowserController(config)
+    controller = BrowserController(config, playwright)
 
     result = {
         "config": config_name,
@@ -84,8 +151,7 @@ def run_single_trial(config: dict, run_id: int, dry_run: bool, output_dir: str)
         time.sleep(duration)
 
         log.info("    Stopping EnergyBridge...")
-        energy_data = profiler.stop()
-        result["energy_data"] = energy_data
+        profiler.stop()
         result["success"] = True
 
     except Exception as e:
@@ -99,11 +165,18 @@ def run_single_trial(config: dict, run_id: int, dry_run: bool, output_dir: str)
         except Exception:
             pass
 
-    results_mgr.save_trial(result)
+    pending = None
+    if io_pool is None:
+        _finish_trial(profiler, result, results_mgr)
+    else:
+        pending = io_pool.submit(_finish_trial, profiler, result, results_mgr)
 
-    cooldown = EXPERIMENT_SETTINGS["cooldown_seconds"]
-    log.info(f"    Cooling down {cooldown}s...")
-    time.sleep(cooldown)
+    log.info(f"    Cooling down (up to {EXPERIMENT_SETTINGS['cooldown_seconds']}s)...")
+    waited = wait_for_idle(EnergyProfiler(dry_run=dry_run), busy=pending)
+    log.info(f"    Idle after {waited:.1f}s")
+
+    if pending is not None:
+        pending.result()
 
     return result
 
@@ -111,7 +184,7 @@ def run_single_trial(config: dict, run_id: int, dry_run: bool, output_dir: str)
 def main():
     args = parse_args()
 
-    Path(args.output_dir).mkdir(exist_ok=True)
+    results_mgr = ResultsManager(args.output_dir)
 
     configs_to_run = CONFIGS
     if args.config:
@@ -123,23 +196,27 @@ def main():
     log.info(f"Starting experiment: {len(configs_to_run)} config(s) x {args.runs} runs each")
 
     summary = []
-    for config in configs_to_run:
-        log.info(f"\n{'='*60}")
-        log.info(f"Config: {config['name']}")
-        log.info(f"{'='*60}")
-
-        config_results = []
-        for run_id in range(args.runs):
-            result = run_single_trial(config, run_id, args.dry_run, args.output_dir)
-            config_results.append(result)
-
-        successes = sum(1 for r in config_results if r["success"])
-        log.info(f"Config {config['name']} done: {successes}/{args.runs} successful")
-        summary.append({"config": config["name"], "successes": successes, "runs": args.runs})
-
-    summary_path = Path(args.output_dir) / "summary.json"
-    with open(summary_path, "w") as f:
-        json.dump(summary, f, indent=2)
+    # One Playwright driver serves every trial; each trial still launches a fresh browser.
+    # Browser teardown stays on this thread (the sync Playwright API is bound to it);
+    # only result collection and the JSON write go to io_pool.
+    with sync_playwright() as pw, ThreadPoolExecutor(max_workers=2) as io_pool:
+        for config in configs_to_run:
+            log.info(f"\n{'='*60}")
+            log.info(f"Config: {config['name']}")
+            log.info(f"{'='*60}")
+
+            config_results = []
+            for run_id in range(args.runs):
+                result = run_single_trial(config, run_id, args.dry_run, results_mgr, pw, io_pool)
+                config_results.append(result)
+
+            successes = sum(1 for r in config_results if r["success"])
+            log.info(f"Config {config['name']} done: {successes}/{args.runs} successful")
+            summary.append({"config": config["name"], "successes": successes, "runs": args.runs})
+
+    shutdown_parse_pool()
+
+    results_mgr.save_summary(summary)
 
     log.info(f"\nExperiment complete. Results in '{args.output_dir}/'")
     log.info(f"Run: python report_data_analysis.py --input-dir {args.output_dir}")
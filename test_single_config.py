@@ -5,6 +5,8 @@ import sys
 logging.basicConfig(level=logging.DEBUG, format="%(asctime)s [%(levelname)s] %(message)s")
 
 from config import CONFIGS
+from results_manager import ResultsManager
+from energy_profiler import shutdown_parse_pool
 from run_experiment import run_single_trial
 
 
@@ -33,7 +35,10 @@ def main():
     print(f"  URL:      {config['url']}")
     print(f"  Dry run:  {args.dry_run}\n")
 
-    result = run_single_trial(config, run_id=0, dry_run=args.dry_run, output_dir=args.output_dir)
+    result = run_single_trial(
+        config, run_id=0, dry_run=args.dry_run, results_mgr=ResultsManager(args.output_dir)
+    )
+    shutdown_parse_pool()
 
     print("\n── Result ──────────────────────────────────")
     print(f"  Success:  {result['success']}")